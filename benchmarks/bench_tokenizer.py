@@ -0,0 +1,54 @@
+"""
+Benchmark the single-pass tokenizer against the original extraction pipeline.
+
+Usage:
+    python benchmarks/bench_tokenizer.py
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from acronymcreator.core import AcronymCreator, AcronymOptions  # noqa: E402
+
+SHORT = "The Quick Brown Fox"
+LONG = " ".join(
+    ["Application, Programming! Interface of the (very) long-winded phrase"] * 50
+)
+
+
+def legacy_extract_words(creator, phrase, options):
+    """The clean_phrase + split + two list comprehension pipeline."""
+    if not phrase.strip():
+        return []
+    cleaned = re.sub(r"[^\w\s]", "", phrase)
+    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    words = cleaned.split()
+    if not options.include_articles:
+        words = [w for w in words if w.lower() not in creator.COMMON_WORDS]
+    return [w for w in words if len(w) >= options.min_word_length]
+
+
+def bench(func, number):
+    """Return the best per-call time in microseconds over five repeats."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    creator = AcronymCreator()
+    options = AcronymOptions()
+    print(f"{'case':<8}{'legacy (us)':>14}{'fused (us)':>14}{'speedup':>10}")
+    for name, phrase, number in (("short", SHORT, 20000), ("long", LONG, 500)):
+        assert creator.extract_words(phrase, options) == legacy_extract_words(
+            creator, phrase, options
+        )
+        legacy = bench(lambda: legacy_extract_words(creator, phrase, options), number)
+        fused = bench(lambda: creator.extract_words(phrase, options), number)
+        print(f"{name:<8}{legacy:>14.2f}{fused:>14.2f}{legacy / fused:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
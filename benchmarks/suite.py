@@ -0,0 +1,205 @@
+"""
+Benchmark suite for AcronymCreator.
+
+Times the core strategies on short, long and punctuation-heavy phrases and
+the CLI cold-start time for every output format. Results are stored as JSON
+so a later run can be compared against a saved baseline.
+
+Usage:
+    python benchmarks/suite.py run --output results.json
+    python benchmarks/suite.py compare baseline.json results.json --threshold 0.1
+    python benchmarks/suite.py run --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from acronymcreator.core import AcronymCreator, AcronymOptions  # noqa: E402
+from acronymcreator.formatters import FORMATTERS  # noqa: E402
+
+DEFAULT_THRESHOLD = 0.10
+
+PHRASES = {
+    "short": "The Quick Brown Fox",
+    "long": " ".join(
+        ["Application Programming Interface for the Distributed Systems Team"] * 20
+    ),
+    "punctuation": (
+        "Hello, World! (Really) -- it's a [very] *punctuated*; phrase: "
+        "e-mail/web & co. #1 @home... ?!"
+    )
+    * 5,
+}
+
+# Benchmark cases are (name, function, calls per timing) triples.
+Case = Tuple[str, Callable[[], object], int]
+
+
+def core_cases() -> Iterator[Case]:
+    """Cases for the core acronym strategies."""
+    creator = AcronymCreator()
+    options = AcronymOptions()
+    for label, phrase in PHRASES.items():
+        number = 2000 if label == "short" else 200
+        yield (
+            f"core.basic.{label}",
+            lambda p=phrase: creator.create_basic_acronym(p, options),
+            number,
+        )
+        yield (
+            f"core.syllable.{label}",
+            lambda p=phrase: creator.create_syllable_acronym(p, options),
+            number,
+        )
+        yield (
+            f"core.multiple.{label}",
+            lambda p=phrase: creator.generate_multiple_options(p),
+            number,
+        )
+
+
+def cli_cases() -> Iterator[Case]:
+    """Cold-start cases: one fresh interpreter per CLI call."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    for name in FORMATTERS:
+        command = [
+            sys.executable,
+            "-m",
+            "acronymcreator.cli",
+            PHRASES["short"],
+            "--format",
+            name,
+        ]
+        yield (
+            f"cli.cold_start.{name}",
+            lambda c=command: subprocess.run(
+                c, env=env, check=True, stdout=subprocess.DEVNULL
+            ),
+            1,
+        )
+
+
+CASE_GROUPS = {"core": core_cases, "cli": cli_cases}
+
+
+def time_case(func: Callable[[], object], number: int, repeat: int) -> float:
+    """Return the best observed seconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(groups: List[str], repeat: int, name_filter: str = "") -> dict:
+    """Run the selected benchmark groups and return a results document."""
+    results: Dict[str, dict] = {}
+    for group in groups:
+        for name, func, number in CASE_GROUPS[group]():
+            if name_filter and name_filter not in name:
+                continue
+            seconds = time_case(func, number, repeat)
+            results[name] = {"seconds_per_call": seconds, "calls": number}
+            print(f"{name:<40}{seconds * 1e6:>14.2f} us", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[dict]:
+    """Compare two results documents case by case.
+
+    A case regresses when its time grows by more than ``threshold`` (a
+    fraction, so 0.1 means 10% slower) relative to the baseline. Cases that
+    exist in only one of the documents are reported but never regress.
+    """
+    rows = []
+    base_results = baseline["results"]
+    current_results = current["results"]
+    for name in sorted(set(base_results) | set(current_results)):
+        if name not in base_results or name not in current_results:
+            rows.append({"case": name, "ratio": None, "regressed": False})
+            continue
+        before = base_results[name]["seconds_per_call"]
+        after = current_results[name]["seconds_per_call"]
+        ratio = after / before if before else float("inf")
+        rows.append({"case": name, "ratio": ratio, "regressed": ratio > 1 + threshold})
+    return rows
+
+
+def report(rows: List[dict]) -> bool:
+    """Print a comparison table and return True if nothing regressed."""
+    ok = True
+    for row in rows:
+        if row["ratio"] is None:
+            status, ratio = "MISSING", "-"
+        else:
+            status = "REGRESSED" if row["regressed"] else "ok"
+            ratio = f"{row['ratio']:.2f}x"
+        ok = ok and not row["regressed"]
+        print(f"{row['case']:<40}{ratio:>10}  {status}")
+    return ok
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument(
+        "--group",
+        action="append",
+        choices=sorted(CASE_GROUPS),
+        help="benchmark group to run (repeatable, default: all)",
+    )
+    run_parser.add_argument("--filter", default="", help="only run matching cases")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--output", help="write results JSON to this file")
+    run_parser.add_argument("--compare", help="baseline JSON to compare against")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        rows = compare(load(args.baseline), load(args.current), args.threshold)
+        return 0 if report(rows) else 1
+
+    current = run(args.group or list(CASE_GROUPS), args.repeat, args.filter)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(current, handle, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        rows = compare(load(args.compare), current, args.threshold)
+        return 0 if report(rows) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+asyncio API for bulk acronym generation.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_MAX_CONCURRENCY = 4
+
+Phrases = Union[AsyncIterable[str], Iterable[str]]
+
+
+def _run_batch(func, batch: List[str], args: tuple) -> list:
+    return [func(phrase, *args) for phrase in batch]
+
+
+async def _aiter(phrases: Phrases) -> AsyncIterator[str]:
+    if hasattr(phrases, "__aiter__"):
+        async for phrase in phrases:
+            yield phrase
+    else:
+        for phrase in phrases:
+            yield phrase
+
+
+async def _next_batch(source: AsyncIterator[str], size: int) -> List[str]:
+    batch = []
+    async for phrase in source:
+        batch.append(phrase)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+def arun_many(
+    creator: Any,
+    method: str,
+    phrases: Phrases,
+    args: tuple = (),
+    batch_size: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Apply ``creator.<method>(phrase, *args)`` off the event loop.
+
+    Yields ``(phrase, result)`` pairs in input order. Phrases are pulled from
+    ``phrases`` (a sync or async iterable) in batches of ``batch_size`` and
+    each batch runs on ``executor`` (default: the loop's default executor).
+    At most ``max_concurrency`` batches are in flight. No more input is read
+    until the consumer takes results, so a slow consumer applies back-pressure
+    all the way to the source.
+    """
+    batch_size = DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+    if max_concurrency is None:
+        max_concurrency = DEFAULT_MAX_CONCURRENCY
+    if batch_size < 1 or max_concurrency < 1:
+        raise ValueError("batch_size and max_concurrency must be at least 1")
+    return _arun_many(
+        creator, method, phrases, args, batch_size, max_concurrency, executor
+    )
+
+
+async def _arun_many(
+    creator: Any,
+    method: str,
+    phrases: Phrases,
+    args: tuple,
+    batch_size: int,
+    max_concurrency: int,
+    executor: Optional[Executor],
+) -> AsyncIterator[Tuple[str, Any]]:
+    loop = asyncio.get_running_loop()
+    func = getattr(creator, method)
+    source = _aiter(phrases).__aiter__()
+    pending: deque = deque()
+    exhausted = False
+
+    async def fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(pending) < max_concurrency:
+            batch = await _next_batch(source, batch_size)
+            if len(batch) < batch_size:
+                exhausted = True
+            if batch:
+                future = loop.run_in_executor(executor, _run_batch, func, batch, args)
+                pending.append((batch, future))
+
+    try:
+        await fill()
+        while pending:
+            batch, future = pending.popleft()
+            results = await future
+            await fill()
+            for item in zip(batch, results):
+                yield item
+    finally:
+        for _, future in pending:
+            future.cancel()
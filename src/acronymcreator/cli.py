@@ -2,19 +2,85 @@
 Command line interface for AcronymCreator.
 """
 
-import csv
-import io
-import json
-import yaml
-import tomli_w
+import os
+import sys
 import click
 from .core import AcronymCreator, AcronymOptions
+from .formatters import FORMATTERS, get_formatter
+from .writers import DEFAULT_FLUSH_EVERY, BatchWriter
 
 # Trigger CI build
 
 
-@click.command()
-@click.argument("phrase", required=True)
+def _open_input(path):
+    """Open ``--input`` for line iteration.
+
+    Regular files are memory-mapped and decoded one line at a time; stdin
+    (``-``) and other non-seekable inputs use ordinary text I/O.
+    """
+    if path != "-" and os.path.isfile(path):
+        from .readers import MappedLineReader
+
+        return MappedLineReader(path)
+    return click.open_file(path, "r")
+
+
+def _write_batch(lines, creator, options, settings, writer):
+    """Write one result per input line through ``writer``.
+
+    The creator and options are reused for every line, and results are
+    handed to the writer as they are computed so memory does not grow with
+    input size. Lines that yield no acronym still produce a record (with an
+    empty acronym) so output rows stay aligned with input rows.
+    """
+    with writer:
+        for line in lines:
+            phrase = line.rstrip("\r\n")
+            acronym = creator.create_basic_acronym(phrase, options)
+            writer.write(phrase, acronym, settings)
+
+
+class DefaultCommandGroup(click.Group):
+    """A command group that falls back to a default command.
+
+    ``acronymcreator "Some Phrase" --format json`` keeps working alongside
+    subcommands such as ``acronymcreator serve``: when the first argument is
+    not a registered subcommand, the default command is invoked with all of
+    the arguments. Top-level ``--help`` shows the default command's help
+    followed by the list of subcommands.
+    """
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx, args):
+        passthrough = set(ctx.help_option_names) | {"--version"}
+        if not args or (args[0] not in self.commands and args[0] not in passthrough):
+            args = [self.default_command] + list(args)
+        return super().parse_args(ctx, args)
+
+    def format_help(self, ctx, formatter):
+        command = self.commands[self.default_command]
+        command_ctx = click.Context(command, info_name=ctx.info_name, parent=ctx.parent)
+        command.format_help(command_ctx, formatter)
+        self.format_commands(ctx, formatter)
+
+
+@click.group(cls=DefaultCommandGroup, default_command="create")
+@click.version_option(version="0.1.0", prog_name="acronymcreator")
+def main():
+    """Generate acronyms from phrases."""
+
+
+@main.command()
+@click.argument("phrase", required=False)
+@click.option(
+    "--input",
+    "input_file",
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+    help="Read phrases from FILE, one per line ('-' for stdin)",
+)
 @click.option(
     "--include-articles",
     is_flag=True,
@@ -33,14 +99,28 @@ from .core import AcronymCreator, AcronymOptions
 )
 @click.option(
     "--format",
-    type=click.Choice(
-        ["text", "json", "yaml", "csv", "tsv", "toml"], case_sensitive=False
-    ),
+    type=click.Choice(list(FORMATTERS), case_sensitive=False),
     default="text",
     help="Output format (default: text)",
 )
+@click.option(
+    "--flush-every",
+    type=click.IntRange(min=1),
+    default=DEFAULT_FLUSH_EVERY,
+    show_default=True,
+    help="With --input, flush output after this many results",
+)
 @click.version_option(version="0.1.0", prog_name="acronymcreator")
-def main(phrase, include_articles, min_length, max_words, lowercase, format):
+def create(
+    phrase,
+    input_file,
+    include_articles,
+    min_length,
+    max_words,
+    lowercase,
+    format,
+    flush_every,
+):
     """Generate acronyms from phrases.
 
     PHRASE: The phrase to create an acronym from
@@ -52,7 +132,14 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
         acronymcreator "Application Programming Interface" --include-articles
 
         acronymcreator "Very Long Phrase With Many Words" --max-words 3
+
+        acronymcreator --input phrases.txt --format csv
+
+        cat phrases.txt | acronymcreator --input -
     """
+    if (phrase is None) == (input_file is None):
+        raise click.UsageError("Provide either a PHRASE or --input, but not both.")
+
     creator = AcronymCreator()
     options = AcronymOptions(
         include_articles=include_articles,
@@ -60,6 +147,18 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
         max_words=max_words,
         force_uppercase=not lowercase,
     )
+    settings = {
+        "include_articles": include_articles,
+        "min_word_length": min_length,
+        "max_words": max_words,
+        "lowercase": lowercase,
+    }
+
+    if input_file is not None:
+        writer = BatchWriter(get_formatter(format), sys.stdout, flush_every)
+        with _open_input(input_file) as lines:
+            _write_batch(lines, creator, options, settings, writer)
+        return
 
     result = creator.create_basic_acronym(phrase, options)
 
@@ -67,94 +166,45 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
         click.echo("No acronym could be generated from the given phrase.", err=True)
         raise click.Abort()
 
-    if format == "json":
-        output = {
-            "phrase": phrase,
-            "acronym": result,
-            "options": {
-                "include_articles": include_articles,
-                "min_word_length": min_length,
-                "max_words": max_words,
-                "lowercase": lowercase,
-            },
-        }
-        click.echo(json.dumps(output, indent=2))
-    elif format == "yaml":
-        output = {
-            "phrase": phrase,
-            "acronym": result,
-            "options": {
-                "include_articles": include_articles,
-                "min_word_length": min_length,
-                "max_words": max_words,
-                "lowercase": lowercase,
-            },
-        }
-        click.echo(yaml.dump(output, default_flow_style=False))
-    elif format == "csv":
-        output_buffer = io.StringIO()
-        csv_writer = csv.writer(output_buffer)
-        # Write header
-        csv_writer.writerow(
-            [
-                "phrase",
-                "acronym",
-                "include_articles",
-                "min_word_length",
-                "max_words",
-                "lowercase",
-            ]
-        )
-        # Write data row
-        csv_writer.writerow(
-            [
-                phrase,
-                result,
-                str(include_articles).lower(),
-                min_length,
-                max_words if max_words is not None else "",
-                str(lowercase).lower(),
-            ]
-        )
-        click.echo(output_buffer.getvalue().rstrip())
-    elif format == "tsv":
-        output_buffer = io.StringIO()
-        tsv_writer = csv.writer(output_buffer, delimiter="\t")
-        # Write header
-        tsv_writer.writerow(
-            [
-                "phrase",
-                "acronym",
-                "include_articles",
-                "min_word_length",
-                "max_words",
-                "lowercase",
-            ]
-        )
-        # Write data row
-        tsv_writer.writerow(
-            [
-                phrase,
-                result,
-                str(include_articles).lower(),
-                min_length,
-                max_words if max_words is not None else "",
-                str(lowercase).lower(),
-            ]
-        )
-        click.echo(output_buffer.getvalue().rstrip())
-    elif format == "toml":
-        output = {
-            "phrase": phrase,
-            "acronym": result,
-            "include_articles": include_articles,
-            "min_word_length": min_length,
-            "max_words": max_words if max_words is not None else "",
-            "lowercase": lowercase,
-        }
-        click.echo(tomli_w.dumps(output).rstrip())
-    else:
-        click.echo(result)
+    click.echo(get_formatter(format).format_single(phrase, result, settings))
+
+
+@main.command()
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    show_default=True,
+    help="Interface to listen on for HTTP",
+)
+@click.option("--port", type=int, default=8765, show_default=True, help="HTTP port")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Listen on this Unix domain socket instead of HTTP",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=0),
+    default=10000,
+    show_default=True,
+    help="Number of results to keep in the in-memory LRU cache (0 disables it)",
+)
+@click.option("--verbose", is_flag=True, default=False, help="Log every request")
+def serve(host, port, socket_path, cache_size, verbose):
+    """Run a local JSON server that keeps one AcronymCreator warm.
+
+    Endpoints: POST /acronym, POST /batch and GET /health. Responses use the
+    same shape as --format json. Stop with Ctrl+C or SIGTERM; in-flight
+    requests are completed before exiting.
+    """
+    from .server import AcronymService, create_server, serve_until_stopped
+
+    service = AcronymService(AcronymCreator(cache_size=cache_size or None))
+    server = create_server(host, port, socket_path, service, verbose)
+    address = socket_path or "http://%s:%d" % server.server_address[:2]
+    click.echo(f"Serving acronyms on {address}", err=True)
+    serve_until_stopped(server)
 
 
 if __name__ == "__main__":
@@ -2,14 +2,25 @@
 Core functionality for AcronymCreator.
 """
 
+import functools
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional, Tuple
 
+from . import parallel, tokenizer
+from .cache import CacheStats, LRUCache
 
-@dataclass
+# Phrases longer than this are never cached, so one entry cannot pin an
+# arbitrarily large key in memory.
+MAX_CACHED_PHRASE_LENGTH = 1024
+
+
+@dataclass(frozen=True)
 class AcronymOptions:
-    """Configuration options for acronym generation."""
+    """Configuration options for acronym generation.
+
+    Instances are immutable and hashable so they can be used in cache keys.
+    """
 
     include_articles: bool = False
     min_word_length: int = 2
@@ -17,8 +28,41 @@ class AcronymOptions:
     force_uppercase: bool = True
 
 
+def _memoized(copy: Optional[Callable] = None):
+    """Cache a ``(phrase, *args)`` method in the creator's LRU cache, if enabled.
+
+    ``copy`` is applied to values handed back to callers so that mutating a
+    returned list or dict cannot corrupt the cached entry.
+    """
+
+    def decorator(method):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, phrase, *args):
+            cache = self._cache
+            if cache is None or len(phrase) > MAX_CACHED_PHRASE_LENGTH:
+                return method(self, phrase, *args)
+            value = cache.get_or_compute(
+                (name, phrase) + args, lambda: method(self, phrase, *args)
+            )
+            return copy(value) if copy is not None else value
+
+        return wrapper
+
+    return decorator
+
+
+def _copy_options_dict(results: dict) -> dict:
+    return {strategy: list(values) for strategy, values in results.items()}
+
+
 class AcronymCreator:
-    """Main class for creating acronyms from phrases."""
+    """Main class for creating acronyms from phrases.
+
+    Pass ``cache_size`` to memoize results per ``(phrase, options)`` in a
+    bounded LRU cache; caching is disabled by default.
+    """
 
     # Common articles and prepositions to potentially exclude
     COMMON_WORDS = {
@@ -44,26 +88,29 @@ class AcronymCreator:
         "during",
     }
 
+    def __init__(self, cache_size: Optional[int] = None):
+        self._cache = LRUCache(cache_size) if cache_size else None
+
+    def cache_info(self) -> Optional[CacheStats]:
+        """Return cache hit/miss/eviction counters, or None if caching is off."""
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+
+    def cache_clear(self) -> None:
+        """Empty the result cache and reset its counters."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @_memoized()
     def create_basic_acronym(self, phrase: str, options: AcronymOptions) -> str:
         """Create a basic acronym by taking first letters."""
         if not phrase.strip():
             return ""
 
-        # Use the extract_words method to get filtered words
-        words = self.extract_words(phrase, options)
+        words = self._extract_words(phrase, options)
 
-        # Limit number of words if max_words is specified
-        if options.max_words is not None:
-            words = words[: options.max_words]
-
-        acronym = "".join(word[0] for word in words)
-
-        if options.force_uppercase:
-            acronym = acronym.upper()
-        else:
-            acronym = acronym.lower()
-
-        return acronym
+        return self._basic_from_words(words, options)
 
     def clean_phrase(self, phrase: str) -> str:
         """Clean a phrase by removing special characters and normalizing whitespace."""
@@ -76,80 +123,55 @@ class AcronymCreator:
 
         return cleaned
 
+    @_memoized(copy=list)
     def extract_words(self, phrase: str, options: AcronymOptions) -> list:
         """Extract words from a phrase based on the given options."""
+        return self._extract_words(phrase, options)
+
+    def _extract_words(self, phrase: str, options: AcronymOptions) -> list:
         if not phrase.strip():
             return []
 
-        # Clean the phrase first
-        cleaned_phrase = self.clean_phrase(phrase)
-        words = cleaned_phrase.split()
-
-        # Filter out articles and common words if requested
-        if not options.include_articles:
-            words = [word for word in words if word.lower() not in self.COMMON_WORDS]
-
-        # Filter by minimum word length if specified
-        words = [word for word in words if len(word) >= options.min_word_length]
+        # Strip, split and filter in one pass over the phrase
+        stopwords = (
+            tokenizer.NO_STOPWORDS if options.include_articles else self.COMMON_WORDS
+        )
+        words = tokenizer.extract_words(phrase, stopwords, options.min_word_length)
 
         return words
 
+    @_memoized()
     def create_syllable_acronym(self, phrase: str, options: AcronymOptions) -> str:
         """Create a syllable-based acronym by taking syllables from each word."""
         if not phrase.strip():
             return ""
 
-        words = self.extract_words(phrase, options)
-
-        # Limit number of words if max_words is specified
-        if options.max_words is not None:
-            words = words[: options.max_words]
-
-        syllables = []
-        for word in words:
-            # Syllable extraction: create 2-3 character syllables
-            if len(word) <= 2:
-                syllables.append(word)
-            elif len(word) <= 4:
-                # Short words: take first 2 characters
-                syllables.append(word[:2])
-            else:
-                # Longer words: take first 2-3 characters based on vowel patterns
-                vowels = "aeiouAEIOU"
-                if word[0] in vowels:
-                    # Word starts with vowel: take 3 chars
-                    syllables.append(word[:3])
-                elif len(word) >= 5 and word[1] in vowels:
-                    # Second char is vowel: take first 3 chars
-                    syllables.append(word[:3])
-                else:
-                    # Default: take first 2 chars
-                    syllables.append(word[:2])
-
-        acronym = "".join(syllables)
-
-        if options.force_uppercase:
-            acronym = acronym.upper()
-        else:
-            acronym = acronym.lower()
+        words = self._extract_words(phrase, options)
 
-        return acronym
+        return self._syllable_from_words(words, options)
 
+    @_memoized(copy=_copy_options_dict)
     def generate_multiple_options(self, phrase: str) -> dict:
         """Generate multiple acronym options using different strategies."""
         if not phrase.strip():
             return {"basic": [], "with_articles": [], "creative": [], "syllable": []}
 
+        # Tokenize once; every strategy below is derived from these tokens
+        tokenized = tokenizer.tokenize_phrase(phrase, self.COMMON_WORDS)
+        min_length = _BASIC_OPTIONS.min_word_length
+        words = tokenized.words(False, min_length)
+        words_with_articles = tokenized.words(True, min_length)
+
         results = {}
 
         # Basic acronym (excludes articles)
-        basic_options = AcronymOptions(include_articles=False)
-        basic_result = self.create_basic_acronym(phrase, basic_options)
+        basic_result = self._basic_from_words(words, _BASIC_OPTIONS)
         results["basic"] = [basic_result] if basic_result else []
 
         # With articles
-        with_articles_options = AcronymOptions(include_articles=True)
-        with_articles_result = self.create_basic_acronym(phrase, with_articles_options)
+        with_articles_result = self._basic_from_words(
+            words_with_articles, _WITH_ARTICLES_OPTIONS
+        )
         results["with_articles"] = (
             [with_articles_result] if with_articles_result else []
         )
@@ -158,24 +180,167 @@ class AcronymCreator:
         creative_results = []
         if basic_result:
             # Lowercase version
-            lowercase_options = AcronymOptions(
-                include_articles=False, force_uppercase=False
-            )
-            lowercase_result = self.create_basic_acronym(phrase, lowercase_options)
+            lowercase_result = self._basic_from_words(words, _LOWERCASE_OPTIONS)
             if lowercase_result.lower() != basic_result.lower():
                 creative_results.append(lowercase_result)
 
             # Limited words version
-            limited_options = AcronymOptions(include_articles=False, max_words=3)
-            limited_result = self.create_basic_acronym(phrase, limited_options)
+            limited_result = self._basic_from_words(words, _LIMITED_OPTIONS)
             if limited_result and limited_result != basic_result:
                 creative_results.append(limited_result)
 
         results["creative"] = creative_results
 
         # Syllable-based
-        syllable_options = AcronymOptions(include_articles=False)
-        syllable_result = self.create_syllable_acronym(phrase, syllable_options)
+        syllable_result = self._syllable_from_words(words, _BASIC_OPTIONS)
         results["syllable"] = [syllable_result] if syllable_result else []
 
         return results
+
+    def create_many(
+        self,
+        phrases: Iterable[str],
+        options: AcronymOptions,
+        workers: Optional[int] = None,
+        chunk_size: int = parallel.DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        parallel_threshold: int = parallel.DEFAULT_PARALLEL_THRESHOLD,
+    ) -> Iterator[Tuple[str, str]]:
+        """Create basic acronyms for many phrases, using a process pool.
+
+        Yields ``(phrase, acronym)`` pairs. See ``parallel.run_many`` for the
+        meaning of the execution arguments.
+        """
+        return parallel.run_many(
+            self,
+            "create_basic_acronym",
+            phrases,
+            (options,),
+            workers=workers,
+            chunk_size=chunk_size,
+            ordered=ordered,
+            parallel_threshold=parallel_threshold,
+        )
+
+    def generate_many(
+        self,
+        phrases: Iterable[str],
+        workers: Optional[int] = None,
+        chunk_size: int = parallel.DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        parallel_threshold: int = parallel.DEFAULT_PARALLEL_THRESHOLD,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Run generate_multiple_options over many phrases, using a process pool.
+
+        Yields ``(phrase, options_dict)`` pairs. See ``parallel.run_many`` for
+        the meaning of the execution arguments.
+        """
+        return parallel.run_many(
+            self,
+            "generate_multiple_options",
+            phrases,
+            workers=workers,
+            chunk_size=chunk_size,
+            ordered=ordered,
+            parallel_threshold=parallel_threshold,
+        )
+
+    def acreate_many(
+        self,
+        phrases,
+        options: AcronymOptions,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        executor=None,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """Async version of create_many for asyncio services.
+
+        ``phrases`` may be a sync or async iterable. Work runs on ``executor``
+        in batches so the event loop stays responsive; see ``aio.arun_many``.
+        Use as ``async for phrase, acronym in creator.acreate_many(...)``.
+        """
+        from . import aio
+
+        return aio.arun_many(
+            self,
+            "create_basic_acronym",
+            phrases,
+            (options,),
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            executor=executor,
+        )
+
+    def agenerate_many(
+        self,
+        phrases,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        executor=None,
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """Async version of generate_many; see ``aio.arun_many``."""
+        from . import aio
+
+        return aio.arun_many(
+            self,
+            "generate_multiple_options",
+            phrases,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            executor=executor,
+        )
+
+    def _basic_from_words(self, words: list, options: AcronymOptions) -> str:
+        """Build a first-letter acronym from already extracted words."""
+        # Limit number of words if max_words is specified
+        if options.max_words is not None:
+            words = words[: options.max_words]
+
+        acronym = "".join(word[0] for word in words)
+
+        return self._apply_case(acronym, options)
+
+    def _syllable_from_words(self, words: list, options: AcronymOptions) -> str:
+        """Build a syllable acronym from already extracted words."""
+        # Limit number of words if max_words is specified
+        if options.max_words is not None:
+            words = words[: options.max_words]
+
+        syllables = []
+        for word in words:
+            # Syllable extraction: create 2-3 character syllables
+            if len(word) <= 2:
+                syllables.append(word)
+            elif len(word) <= 4:
+                # Short words: take first 2 characters
+                syllables.append(word[:2])
+            else:
+                # Longer words: take first 2-3 characters based on vowel patterns
+                vowels = "aeiouAEIOU"
+                if word[0] in vowels:
+                    # Word starts with vowel: take 3 chars
+                    syllables.append(word[:3])
+                elif len(word) >= 5 and word[1] in vowels:
+                    # Second char is vowel: take first 3 chars
+                    syllables.append(word[:3])
+                else:
+                    # Default: take first 2 chars
+                    syllables.append(word[:2])
+
+        acronym = "".join(syllables)
+
+        return self._apply_case(acronym, options)
+
+    @staticmethod
+    def _apply_case(acronym: str, options: AcronymOptions) -> str:
+        """Apply the case requested by the options."""
+        if options.force_uppercase:
+            return acronym.upper()
+        return acronym.lower()
+
+
+# Option sets used by generate_multiple_options
+_BASIC_OPTIONS = AcronymOptions(include_articles=False)
+_WITH_ARTICLES_OPTIONS = AcronymOptions(include_articles=True)
+_LOWERCASE_OPTIONS = AcronymOptions(include_articles=False, force_uppercase=False)
+_LIMITED_OPTIONS = AcronymOptions(include_articles=False, max_words=3)
@@ -0,0 +1,210 @@
+"""
+Output formatters for the AcronymCreator CLI.
+
+Each formatter imports its serializer when it is instantiated, so a run only
+pays the import cost of the format it actually uses.
+"""
+
+from typing import Dict, TextIO
+
+CSV_COLUMNS = [
+    "phrase",
+    "acronym",
+    "include_articles",
+    "min_word_length",
+    "max_words",
+    "lowercase",
+]
+
+
+def structured_record(phrase: str, acronym: str, settings: dict) -> dict:
+    """Build the nested record used by the json and yaml formats."""
+    return {"phrase": phrase, "acronym": acronym, "options": dict(settings)}
+
+
+def flat_record(phrase: str, acronym: str, settings: dict) -> dict:
+    """Build the flat record used by the toml format."""
+    return {
+        "phrase": phrase,
+        "acronym": acronym,
+        "include_articles": settings["include_articles"],
+        "min_word_length": settings["min_word_length"],
+        "max_words": (
+            settings["max_words"] if settings["max_words"] is not None else ""
+        ),
+        "lowercase": settings["lowercase"],
+    }
+
+
+def csv_row(phrase: str, acronym: str, settings: dict) -> list:
+    """Build a csv/tsv data row."""
+    return [
+        phrase,
+        acronym,
+        str(settings["include_articles"]).lower(),
+        settings["min_word_length"],
+        settings["max_words"] if settings["max_words"] is not None else "",
+        str(settings["lowercase"]).lower(),
+    ]
+
+
+class Formatter:
+    """Renders acronym results for one output format.
+
+    ``format_single`` renders a standalone result. ``begin``, ``write`` and
+    ``end`` stream many results so that the concatenated output is still a
+    valid document of the format.
+    """
+
+    def format_single(self, phrase: str, acronym: str, settings: dict) -> str:
+        raise NotImplementedError
+
+    def begin(self, stream: TextIO) -> None:
+        """Write anything that must precede the first streamed result."""
+
+    def write(self, stream: TextIO, phrase: str, acronym: str, settings: dict):
+        raise NotImplementedError
+
+    def end(self, stream: TextIO) -> None:
+        """Write anything that must follow the last streamed result."""
+
+
+class TextFormatter(Formatter):
+    """Plain acronym, one per line."""
+
+    def format_single(self, phrase, acronym, settings):
+        return acronym
+
+    def write(self, stream, phrase, acronym, settings):
+        stream.write(acronym + "\n")
+
+
+class JsonFormatter(Formatter):
+    """Indented JSON for one result, a JSON array when streaming."""
+
+    def __init__(self):
+        import json
+
+        self._json = json
+        self._separator = ""
+
+    def format_single(self, phrase, acronym, settings):
+        record = structured_record(phrase, acronym, settings)
+        return self._json.dumps(record, indent=2)
+
+    def begin(self, stream):
+        stream.write("[")
+        self._separator = "\n"
+
+    def write(self, stream, phrase, acronym, settings):
+        record = structured_record(phrase, acronym, settings)
+        stream.write(self._separator + self._json.dumps(record))
+        self._separator = ",\n"
+
+    def end(self, stream):
+        stream.write("\n]\n" if self._separator == ",\n" else "]\n")
+
+
+class JsonLinesFormatter(Formatter):
+    """One compact JSON object per line."""
+
+    def __init__(self):
+        import json
+
+        self._json = json
+
+    def format_single(self, phrase, acronym, settings):
+        return self._json.dumps(structured_record(phrase, acronym, settings))
+
+    def write(self, stream, phrase, acronym, settings):
+        record = structured_record(phrase, acronym, settings)
+        stream.write(self._json.dumps(record) + "\n")
+
+
+class YamlFormatter(Formatter):
+    """YAML mapping for one result, a YAML sequence when streaming."""
+
+    def __init__(self):
+        import yaml
+
+        self._yaml = yaml
+
+    def format_single(self, phrase, acronym, settings):
+        record = structured_record(phrase, acronym, settings)
+        return self._yaml.dump(record, default_flow_style=False)
+
+    def write(self, stream, phrase, acronym, settings):
+        # Each record is a list item, so the concatenated output is a
+        # single YAML sequence.
+        record = structured_record(phrase, acronym, settings)
+        stream.write(self._yaml.dump([record], default_flow_style=False))
+
+
+class CsvFormatter(Formatter):
+    """Delimited rows with a single header row."""
+
+    delimiter = ","
+
+    def __init__(self):
+        import csv
+        import io
+
+        self._csv = csv
+        self._io = io
+        self._writer = None
+
+    def format_single(self, phrase, acronym, settings):
+        output_buffer = self._io.StringIO()
+        writer = self._csv.writer(output_buffer, delimiter=self.delimiter)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerow(csv_row(phrase, acronym, settings))
+        return output_buffer.getvalue().rstrip()
+
+    def begin(self, stream):
+        self._writer = self._csv.writer(stream, delimiter=self.delimiter)
+        self._writer.writerow(CSV_COLUMNS)
+
+    def write(self, stream, phrase, acronym, settings):
+        self._writer.writerow(csv_row(phrase, acronym, settings))
+
+
+class TsvFormatter(CsvFormatter):
+    """Tab-separated rows with a single header row."""
+
+    delimiter = "\t"
+
+
+class TomlFormatter(Formatter):
+    """Flat TOML table for one result, ``[[results]]`` tables when streaming."""
+
+    def __init__(self):
+        import tomli_w
+
+        self._tomli_w = tomli_w
+
+    def format_single(self, phrase, acronym, settings):
+        return self._tomli_w.dumps(flat_record(phrase, acronym, settings)).rstrip()
+
+    def write(self, stream, phrase, acronym, settings):
+        record = flat_record(phrase, acronym, settings)
+        stream.write("[[results]]\n" + self._tomli_w.dumps(record) + "\n")
+
+
+FORMATTERS: Dict[str, type] = {
+    "text": TextFormatter,
+    "json": JsonFormatter,
+    "jsonl": JsonLinesFormatter,
+    "yaml": YamlFormatter,
+    "csv": CsvFormatter,
+    "tsv": TsvFormatter,
+    "toml": TomlFormatter,
+}
+
+
+def get_formatter(name: str) -> Formatter:
+    """Create the formatter registered for ``name``, importing its serializer."""
+    try:
+        formatter_class = FORMATTERS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown output format: {name}") from None
+    return formatter_class()
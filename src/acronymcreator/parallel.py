@@ -0,0 +1,130 @@
+"""
+Process-pool execution for bulk acronym generation.
+"""
+
+import os
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Below this many phrases the work runs in-process, because pickling the
+# phrases and results costs more than generating the acronyms.
+DEFAULT_PARALLEL_THRESHOLD = 10000
+
+# One creator per worker process and creator class, reused across chunks.
+_worker_creators: Dict[type, Any] = {}
+
+
+def _run_chunk(creator_class: type, method: str, chunk: List[str], args: tuple):
+    """Worker entry point: apply ``method`` to every phrase in ``chunk``."""
+    creator = _worker_creators.get(creator_class)
+    if creator is None:
+        creator = _worker_creators[creator_class] = creator_class()
+    func = getattr(creator, method)
+    return [func(phrase, *args) for phrase in chunk]
+
+
+def _chunked(phrases: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(phrases)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_many(
+    creator: Any,
+    method: str,
+    phrases: Iterable[str],
+    args: tuple = (),
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+    parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+) -> Iterator[Tuple[str, Any]]:
+    """Apply ``creator.<method>(phrase, *args)`` to many phrases.
+
+    Yields ``(phrase, result)`` pairs. Phrases are split into chunks of
+    ``chunk_size`` and fanned out over a process pool with ``workers``
+    processes (default: CPU count). Only ``2 * workers`` chunks are in flight
+    at once, so ``phrases`` may be an arbitrarily large iterator. With
+    ``ordered=False`` chunks are yielded as they complete.
+
+    If fewer than ``parallel_threshold`` phrases are given, or ``workers`` is
+    1, everything runs in-process on ``creator`` itself. Worker processes use
+    fresh instances of ``type(creator)``, so an in-process cache is not shared.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return _iter_many(
+        creator, method, phrases, args, workers, chunk_size, ordered, parallel_threshold
+    )
+
+
+def _iter_many(
+    creator: Any,
+    method: str,
+    phrases: Iterable[str],
+    args: tuple,
+    workers: int,
+    chunk_size: int,
+    ordered: bool,
+    parallel_threshold: int,
+) -> Iterator[Tuple[str, Any]]:
+    iterator = iter(phrases)
+    head = list(islice(iterator, parallel_threshold))
+    if workers <= 1 or len(head) < parallel_threshold:
+        func = getattr(creator, method)
+        for phrase in chain(head, iterator):
+            yield phrase, func(phrase, *args)
+        return
+
+    # Imported here so that importing the package (and starting the CLI)
+    # does not pull in multiprocessing.
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    creator_class = type(creator)
+    chunks = _chunked(chain(head, iterator), chunk_size)
+    max_pending = workers * 2
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: Any = deque() if ordered else {}
+
+    def submit_next() -> bool:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        future = executor.submit(_run_chunk, creator_class, method, chunk, args)
+        if ordered:
+            pending.append((future, chunk))
+        else:
+            pending[future] = chunk
+        return True
+
+    try:
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        if ordered:
+            while pending:
+                future, chunk = pending.popleft()
+                results = future.result()
+                submit_next()
+                yield from zip(chunk, results)
+        else:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    submit_next()
+                    yield from zip(chunk, future.result())
+    finally:
+        # Reached early if the consumer stops iterating; drop queued work.
+        futures = [future for future, _ in pending] if ordered else list(pending)
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,109 @@
+"""
+Memory-mapped line reader for large phrase corpora.
+"""
+
+import mmap
+import os
+from typing import Iterator, List, Optional, Tuple, Union
+
+BLOCK_SIZE = 1 << 20
+
+
+class MappedLineReader:
+    """Read newline-delimited phrases from a read-only memory map.
+
+    Line boundaries are found in the raw mapped bytes and each line is
+    decoded only when it is yielded, so the file is never decoded or copied
+    as a whole. ``split`` divides the file into line-aligned byte ranges so
+    that several workers can each map the same file and read one region
+    through ``iter_lines(start, end)``.
+
+    Lines are yielded without their line endings.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+        errors: str = "strict",
+    ):
+        self.path = path
+        self.encoding = encoding
+        self.errors = errors
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file.
+        self._map: Optional[mmap.mmap] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.size
+            else None
+        )
+
+    def __enter__(self) -> "MappedLineReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_lines()
+
+    def close(self) -> None:
+        """Unmap the file and close it."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def line_start(self, offset: int) -> int:
+        """Return the offset of the first line starting at or after ``offset``."""
+        if offset <= 0:
+            return 0
+        if offset >= self.size or self._map is None:
+            return self.size
+        if self._map[offset - 1] == 0x0A:
+            return offset
+        newline = self._map.find(b"\n", offset)
+        return self.size if newline < 0 else newline + 1
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        """Divide the file into at most ``parts`` line-aligned byte ranges."""
+        if parts < 1:
+            raise ValueError("parts must be at least 1")
+        bounds = sorted(
+            {self.line_start(self.size * i // parts) for i in range(parts)}
+            | {self.size}
+        )
+        return [(start, end) for start, end in zip(bounds, bounds[1:])]
+
+    def iter_raw_lines(self, start: int = 0, end: Optional[int] = None):
+        """Yield undecoded lines (``bytes``) that begin in ``[start, end)``.
+
+        A line belongs to the range that contains its first byte, so adjacent
+        ranges never share or drop a line even if they are not line-aligned.
+        The range is scanned in blocks of about ``BLOCK_SIZE`` bytes that end
+        on a newline, so only one block is ever copied out of the map.
+        """
+        mapped = self._map
+        if mapped is None:
+            return
+        position = self.line_start(start)
+        stop = self.size if end is None else self.line_start(end)
+        while position < stop:
+            block_end = min(position + BLOCK_SIZE, stop)
+            if block_end < stop:
+                newline = mapped.rfind(b"\n", position, block_end)
+                if newline < 0:
+                    # A single line longer than a block.
+                    newline = mapped.find(b"\n", block_end, stop)
+                block_end = stop if newline < 0 else newline + 1
+            block = mapped[position:block_end]
+            position = block_end
+            # splitlines() matches text-mode universal newlines (\n, \r\n, \r).
+            yield from block.splitlines()
+
+    def iter_lines(self, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+        """Yield decoded lines that begin in ``[start, end)``."""
+        encoding, errors = self.encoding, self.errors
+        for line in self.iter_raw_lines(start, end):
+            yield line.decode(encoding, errors)
@@ -0,0 +1,254 @@
+"""
+Long-running local server for AcronymCreator.
+
+Keeps one warm ``AcronymCreator`` and answers JSON requests over localhost
+HTTP or a Unix domain socket, so callers avoid interpreter startup per call.
+
+Endpoints:
+    GET  /health   -> {"status": "ok"}
+    POST /acronym  {"phrase": ..., "options": {...}} -> same shape as --format json
+    POST /batch    {"phrases": [...], "options": {...}} -> {"results": [...]}
+
+``options`` is optional and uses the keys of the ``--format json`` output:
+``include_articles``, ``min_word_length``, ``max_words`` and ``lowercase``.
+"""
+
+import json
+import os
+import signal
+import socketserver
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+from .core import AcronymCreator, AcronymOptions
+from .formatters import structured_record
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 10000
+
+# Requests larger than this are rejected before their body is read.
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+_DEFAULT_SETTINGS = {
+    "include_articles": False,
+    "min_word_length": 2,
+    "max_words": None,
+    "lowercase": False,
+}
+
+
+class RequestError(ValueError):
+    """A client request that cannot be served; carries the HTTP status."""
+
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_settings(data: Optional[dict]) -> Tuple[dict, AcronymOptions]:
+    """Validate request options and return (settings, AcronymOptions)."""
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise RequestError("'options' must be an object")
+    unknown = set(data) - set(_DEFAULT_SETTINGS)
+    if unknown:
+        raise RequestError(f"Unknown options: {', '.join(sorted(unknown))}")
+
+    settings = dict(_DEFAULT_SETTINGS, **data)
+    for key in ("include_articles", "lowercase"):
+        if not isinstance(settings[key], bool):
+            raise RequestError(f"'{key}' must be a boolean")
+    for key in ("min_word_length", "max_words"):
+        value = settings[key]
+        if value is None and key == "max_words":
+            continue
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise RequestError(f"'{key}' must be an integer")
+
+    options = AcronymOptions(
+        include_articles=settings["include_articles"],
+        min_word_length=settings["min_word_length"],
+        max_words=settings["max_words"],
+        force_uppercase=not settings["lowercase"],
+    )
+    return settings, options
+
+
+class AcronymService:
+    """Transport-independent request handling for the server."""
+
+    def __init__(self, creator: Optional[AcronymCreator] = None):
+        self.creator = creator if creator is not None else AcronymCreator()
+
+    def acronym(self, request: dict) -> dict:
+        """Handle a single-phrase request."""
+        phrase = request.get("phrase")
+        if not isinstance(phrase, str):
+            raise RequestError("'phrase' must be a string")
+        settings, options = parse_settings(request.get("options"))
+        acronym = self.creator.create_basic_acronym(phrase, options)
+        if not acronym:
+            raise RequestError(
+                "No acronym could be generated from the given phrase.",
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+            )
+        return structured_record(phrase, acronym, settings)
+
+    def batch(self, request: dict) -> dict:
+        """Handle a batch request; phrases without an acronym get ''."""
+        phrases = request.get("phrases")
+        if not isinstance(phrases, list) or not all(
+            isinstance(phrase, str) for phrase in phrases
+        ):
+            raise RequestError("'phrases' must be a list of strings")
+        settings, options = parse_settings(request.get("options"))
+        create = self.creator.create_basic_acronym
+        return {
+            "results": [
+                structured_record(phrase, create(phrase, options), settings)
+                for phrase in phrases
+            ]
+        }
+
+
+class AcronymRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler dispatching to the server's ``AcronymService``."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "acronymcreator/0.1.0"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def do_POST(self):
+        routes = {
+            "/acronym": self.server.service.acronym,
+            "/batch": self.server.service.batch,
+        }
+        try:
+            # Always consume the body so a keep-alive connection stays in sync.
+            body = self._read_body()
+            handler = routes.get(self.path)
+            if handler is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+                return
+            self._send_json(HTTPStatus.OK, handler(self._parse_json(body)))
+        except RequestError as error:
+            self._send_json(error.status, {"error": str(error)})
+
+    def _read_body(self) -> bytes:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self.close_connection = True
+            raise RequestError("Invalid Content-Length") from None
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise RequestError(
+                "Request body too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            )
+        return self.rfile.read(length)
+
+    @staticmethod
+    def _parse_json(body: bytes) -> dict:
+        try:
+            data = json.loads(body or b"null")
+        except ValueError:
+            raise RequestError("Request body must be valid JSON") from None
+        if not isinstance(data, dict):
+            raise RequestError("Request body must be a JSON object")
+        return data
+
+    def _send_json(self, status: HTTPStatus, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _ServiceMixin:
+    """Server attributes shared by the TCP and Unix socket servers."""
+
+    daemon_threads = False  # let in-flight requests finish on shutdown
+    block_on_close = True
+    request_queue_size = 128
+    service: AcronymService
+    verbose: bool = False
+
+
+class AcronymHTTPServer(_ServiceMixin, ThreadingHTTPServer):
+    """Threaded localhost HTTP server."""
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class AcronymUnixServer(
+        _ServiceMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+    ):
+        """Threaded HTTP server listening on a Unix domain socket."""
+
+        def server_close(self):
+            super().server_close()
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+
+
+def create_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+    service: Optional[AcronymService] = None,
+    verbose: bool = False,
+):
+    """Create (but do not start) a server bound to TCP or a Unix socket."""
+    if socket_path is not None:
+        if not hasattr(socketserver, "UnixStreamServer"):
+            raise OSError("Unix domain sockets are not supported on this platform")
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = AcronymUnixServer(socket_path, AcronymRequestHandler)
+    else:
+        server = AcronymHTTPServer((host, port), AcronymRequestHandler)
+    server.service = service if service is not None else AcronymService()
+    server.verbose = verbose
+    return server
+
+
+def serve_until_stopped(server) -> None:
+    """Serve until SIGINT or SIGTERM, then finish in-flight requests and exit.
+
+    Must be called from the main thread, since it installs signal handlers.
+    """
+
+    def request_shutdown(signum, frame):
+        # shutdown() blocks until serve_forever() returns, so it has to run
+        # on another thread than the one serving.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    previous = {
+        signum: signal.signal(signum, request_shutdown)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        server.serve_forever()
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        server.server_close()
@@ -0,0 +1,65 @@
+"""
+Tokenizer for AcronymCreator.
+"""
+
+import re
+from typing import AbstractSet, List, NamedTuple
+
+# Runs of characters that are neither word characters nor whitespace.
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+NO_STOPWORDS: AbstractSet[str] = frozenset()
+
+
+def tokenize(phrase: str) -> List[str]:
+    """Split a phrase into cleaned tokens.
+
+    Equivalent to ``AcronymCreator.clean_phrase(phrase).split()``: punctuation
+    is dropped and the result is split on any run of whitespace, so the
+    intermediate whitespace normalization pass is not needed.
+    """
+    return _PUNCTUATION_RE.sub("", phrase).split()
+
+
+def extract_words(
+    phrase: str, stopwords: AbstractSet[str], min_word_length: int
+) -> List[str]:
+    """Tokenize a phrase and filter its words in a single pass.
+
+    Punctuation is stripped and the phrase split once, then the length and
+    stopword filters are applied together while walking the tokens. The
+    length check runs first so ``lower()`` is only called on words that can
+    still be kept.
+    """
+    return [
+        word
+        for word in _PUNCTUATION_RE.sub("", phrase).split()
+        if len(word) >= min_word_length and word.lower() not in stopwords
+    ]
+
+
+class TokenizedPhrase(NamedTuple):
+    """Cleaned tokens of a phrase together with their stopword flags.
+
+    Built once per phrase so several acronym strategies can share the
+    tokenization work instead of re-cleaning the phrase for each one.
+    """
+
+    tokens: List[str]
+    stopword_mask: List[bool]
+
+    def words(self, include_stopwords: bool, min_word_length: int) -> List[str]:
+        """Return the tokens that pass the stopword and length filters."""
+        if include_stopwords:
+            return [word for word in self.tokens if len(word) >= min_word_length]
+        return [
+            word
+            for word, is_stopword in zip(self.tokens, self.stopword_mask)
+            if not is_stopword and len(word) >= min_word_length
+        ]
+
+
+def tokenize_phrase(phrase: str, stopwords: AbstractSet[str]) -> TokenizedPhrase:
+    """Tokenize a phrase and flag which of its tokens are stopwords."""
+    tokens = tokenize(phrase)
+    return TokenizedPhrase(tokens, [word.lower() in stopwords for word in tokens])
@@ -0,0 +1,68 @@
+"""
+Buffered streaming writers for batch output.
+"""
+
+import io
+from typing import TextIO
+
+from .formatters import Formatter
+
+DEFAULT_FLUSH_EVERY = 1000
+
+
+class BatchWriter:
+    """Stream formatted results to ``stream`` in fixed-size batches.
+
+    Rows are rendered into an in-memory buffer that is written to ``stream``
+    and flushed every ``flush_every`` rows, so memory use depends on the batch
+    size rather than on the number of rows. Headers and footers are written
+    once, by ``open`` and ``close``. Use as a context manager or call ``open``
+    and ``close`` explicitly.
+    """
+
+    def __init__(
+        self,
+        formatter: Formatter,
+        stream: TextIO,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+    ):
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        self.formatter = formatter
+        self.stream = stream
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._buffer = io.StringIO()
+        self._pending = 0
+
+    def __enter__(self) -> "BatchWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Write the format header."""
+        self.formatter.begin(self._buffer)
+
+    def write(self, phrase: str, acronym: str, settings: dict) -> None:
+        """Append one result, flushing when the batch is full."""
+        self.formatter.write(self._buffer, phrase, acronym, settings)
+        self.rows_written += 1
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows to the stream and flush it."""
+        self.stream.write(self._buffer.getvalue())
+        self.stream.flush()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._pending = 0
+
+    def close(self) -> None:
+        """Write the format footer and flush everything that is buffered."""
+        self.formatter.end(self._buffer)
+        self.flush()
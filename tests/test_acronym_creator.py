@@ -190,3 +190,34 @@ class TestAcronymCreator:
 
         # Check with articles (should include 'The')
         assert "TQBF" in results["with_articles"]
+
+    def test_generate_multiple_options_matches_individual_strategies(self):
+        """Test shared tokenization gives the same results as separate calls."""
+        phrases = [
+            "The Quick Brown Fox",
+            "One Two Three Four Five",
+            "Point of Sale",
+            "a an the",
+            "Hello, World! How are you?",
+            "Python Programming Language",
+        ]
+        for phrase in phrases:
+            basic = self.creator.create_basic_acronym(phrase, AcronymOptions())
+            with_articles = self.creator.create_basic_acronym(
+                phrase, AcronymOptions(include_articles=True)
+            )
+            limited = self.creator.create_basic_acronym(
+                phrase, AcronymOptions(max_words=3)
+            )
+            syllable = self.creator.create_syllable_acronym(phrase, AcronymOptions())
+            creative = []
+            if basic and limited != basic:
+                creative.append(limited)
+
+            results = self.creator.generate_multiple_options(phrase)
+            assert results == {
+                "basic": [basic] if basic else [],
+                "with_articles": [with_articles] if with_articles else [],
+                "creative": creative,
+                "syllable": [syllable] if syllable else [],
+            }
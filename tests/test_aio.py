@@ -0,0 +1,126 @@
+"""
+Tests for the asyncio bulk API.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.acronymcreator import aio
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+PHRASES = [f"Async Phrase Number {i}" for i in range(50)] + ["", "The Quick Fox"]
+
+
+async def agen(items, delay=0):
+    """Async iterable over ``items``."""
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def collect(aiterator):
+    return [item async for item in aiterator]
+
+
+class TestAsyncAPI:
+    """Test cases for acreate_many / agenerate_many."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.creator = AcronymCreator()
+        self.options = AcronymOptions()
+        self.expected = [
+            (p, self.creator.create_basic_acronym(p, self.options)) for p in PHRASES
+        ]
+
+    def test_acreate_many_async_source(self):
+        """Test results from an async iterable keep input order."""
+        results = asyncio.run(
+            collect(
+                self.creator.acreate_many(
+                    agen(PHRASES), self.options, batch_size=7, max_concurrency=3
+                )
+            )
+        )
+        assert results == self.expected
+
+    def test_acreate_many_sync_source(self):
+        """Test a plain iterable is accepted."""
+        results = asyncio.run(
+            collect(self.creator.acreate_many(iter(PHRASES), self.options))
+        )
+        assert results == self.expected
+
+    def test_agenerate_many_with_executor(self):
+        """Test agenerate_many on an explicit executor."""
+        expected = [(p, self.creator.generate_multiple_options(p)) for p in PHRASES]
+        with ThreadPoolExecutor(2) as executor:
+            results = asyncio.run(
+                collect(
+                    self.creator.agenerate_many(
+                        PHRASES, batch_size=10, executor=executor
+                    )
+                )
+            )
+        assert results == expected
+
+    def test_empty_source(self):
+        """Test an empty source yields nothing."""
+        assert asyncio.run(collect(self.creator.acreate_many([], self.options))) == []
+
+    def test_back_pressure_limits_reads(self):
+        """Test the source is only read as far as in-flight batches allow."""
+        consumed = []
+
+        async def source():
+            for i in range(10000):
+                consumed.append(i)
+                yield f"Phrase {i}"
+
+        async def take_one():
+            results = self.creator.acreate_many(
+                source(), self.options, batch_size=5, max_concurrency=2
+            )
+            first = await results.__anext__()
+            await results.aclose()
+            return first
+
+        assert asyncio.run(take_one()) == ("Phrase 0", "P")
+        # Two batches in flight plus one refill after the first completes.
+        assert len(consumed) <= 5 * 3 + 1
+
+    def test_event_loop_stays_responsive(self):
+        """Test other coroutines keep running while a large batch is processed."""
+
+        async def main():
+            ticks = []
+            stop = asyncio.Event()
+
+            async def ticker():
+                while not stop.is_set():
+                    ticks.append(time.perf_counter())
+                    await asyncio.sleep(0.001)
+
+            task = asyncio.create_task(ticker())
+            phrases = [" ".join(["Long Phrase With Words"] * 20)] * 3000
+            count = 0
+            async for _ in self.creator.acreate_many(phrases, self.options):
+                count += 1
+            stop.set()
+            await task
+            return count, ticks
+
+        count, ticks = asyncio.run(main())
+        assert count == 3000
+        assert len(ticks) > 5
+
+    def test_invalid_arguments(self):
+        """Test invalid batch settings are rejected immediately."""
+        with pytest.raises(ValueError):
+            aio.arun_many(self.creator, "create_basic_acronym", [], batch_size=0)
+        with pytest.raises(ValueError):
+            aio.arun_many(self.creator, "create_basic_acronym", [], max_concurrency=0)
@@ -0,0 +1,71 @@
+"""
+Tests for the benchmark suite's run and compare logic.
+"""
+
+import json
+
+from benchmarks import suite
+
+
+def results(**seconds):
+    """Build a minimal results document."""
+    return {
+        "meta": {},
+        "results": {
+            name: {"seconds_per_call": value, "calls": 1}
+            for name, value in seconds.items()
+        },
+    }
+
+
+class TestBenchmarkSuite:
+    """Test cases for the benchmark suite."""
+
+    def test_compare_flags_regressions_past_threshold(self):
+        """Test only cases slower than the threshold regress."""
+        rows = suite.compare(
+            results(a=1.0, b=1.0, c=1.0),
+            results(a=1.05, b=1.2, c=0.5),
+            threshold=0.1,
+        )
+        regressed = {row["case"]: row["regressed"] for row in rows}
+        assert regressed == {"a": False, "b": True, "c": False}
+
+    def test_compare_reports_missing_cases(self):
+        """Test cases missing from either side are reported, not failed."""
+        rows = suite.compare(results(a=1.0), results(b=1.0), threshold=0.1)
+        assert [(row["case"], row["ratio"]) for row in rows] == [
+            ("a", None),
+            ("b", None),
+        ]
+        assert suite.report(rows)
+
+    def test_report_returns_false_on_regression(self, capsys):
+        """Test report prints a table and fails on regressions."""
+        rows = suite.compare(results(a=1.0), results(a=2.0), threshold=0.1)
+        assert not suite.report(rows)
+        assert "REGRESSED" in capsys.readouterr().out
+
+    def test_run_and_compare_roundtrip(self, tmp_path):
+        """Test a filtered run can be saved and compared against itself."""
+        baseline = tmp_path / "baseline.json"
+        exit_code = suite.main(
+            [
+                "run",
+                "--group",
+                "core",
+                "--filter",
+                "basic.short",
+                "--repeat",
+                "1",
+                "--output",
+                str(baseline),
+            ]
+        )
+        assert exit_code == 0
+        document = json.loads(baseline.read_text())
+        assert list(document["results"]) == ["core.basic.short"]
+        exit_code = suite.main(
+            ["compare", str(baseline), str(baseline), "--threshold", "0"]
+        )
+        assert exit_code == 0
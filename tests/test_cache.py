@@ -0,0 +1,121 @@
+"""
+Tests for the LRU result cache.
+"""
+
+import pytest
+
+from src.acronymcreator.cache import LRUCache
+from src.acronymcreator.core import (
+    MAX_CACHED_PHRASE_LENGTH,
+    AcronymCreator,
+    AcronymOptions,
+)
+
+
+class TestLRUCache:
+    """Test cases for the LRUCache class."""
+
+    def test_hit_and_miss_counters(self):
+        """Test hits and misses are counted."""
+        cache = LRUCache(2)
+        assert cache.get_or_compute("a", lambda: 1) == 1
+        assert cache.get_or_compute("a", lambda: 2) == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 0)
+        assert (stats.size, stats.maxsize) == (1, 2)
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted first."""
+        cache = LRUCache(2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 0)  # "a" is now most recent
+        cache.get_or_compute("c", lambda: 3)  # evicts "b"
+        assert cache.get_or_compute("a", lambda: -1) == 1
+        assert cache.get_or_compute("b", lambda: -2) == -2
+        assert cache.stats().evictions == 2
+
+    def test_size_stays_bounded(self):
+        """Test the cache never grows past maxsize on unique keys."""
+        cache = LRUCache(10)
+        for i in range(1000):
+            cache.get_or_compute(i, lambda: i)
+        assert len(cache) == 10
+        assert cache.stats().evictions == 990
+
+    def test_clear_resets(self):
+        """Test clear removes entries and resets counters."""
+        cache = LRUCache(2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.clear()
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+
+    def test_invalid_maxsize(self):
+        """Test a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+
+class TestAcronymCreatorCache:
+    """Test cases for memoization on AcronymCreator."""
+
+    def test_cache_disabled_by_default(self):
+        """Test caching is opt-in."""
+        creator = AcronymCreator()
+        assert creator.cache_info() is None
+        creator.cache_clear()
+        assert creator.create_basic_acronym("Hello World", AcronymOptions()) == "HW"
+
+    def test_options_are_hashable(self):
+        """Test options can be used as cache keys."""
+        assert hash(AcronymOptions()) == hash(AcronymOptions())
+        assert AcronymOptions(max_words=2) != AcronymOptions()
+
+    def test_basic_acronym_is_cached_per_options(self):
+        """Test results are keyed by phrase and options."""
+        creator = AcronymCreator(cache_size=16)
+        upper = AcronymOptions()
+        lower = AcronymOptions(force_uppercase=False)
+        assert creator.create_basic_acronym("Hello World", upper) == "HW"
+        assert creator.create_basic_acronym("Hello World", upper) == "HW"
+        assert creator.create_basic_acronym("Hello World", lower) == "hw"
+        stats = creator.cache_info()
+        assert (stats.hits, stats.misses) == (1, 2)
+
+    def test_strategies_do_not_share_entries(self):
+        """Test basic and syllable results are cached separately."""
+        creator = AcronymCreator(cache_size=16)
+        options = AcronymOptions()
+        assert creator.create_basic_acronym("Hello World", options) == "HW"
+        assert creator.create_syllable_acronym("Hello World", options) == "HELWOR"
+        assert creator.cache_info().misses == 2
+
+    def test_cached_lists_are_copied(self):
+        """Test mutating a returned result does not affect the cache."""
+        creator = AcronymCreator(cache_size=16)
+        options = AcronymOptions()
+        creator.extract_words("Hello World", options).append("junk")
+        assert creator.extract_words("Hello World", options) == ["Hello", "World"]
+
+        creator.generate_multiple_options("The Quick Brown Fox")["basic"].clear()
+        results = creator.generate_multiple_options("The Quick Brown Fox")
+        assert results["basic"] == ["QBF"]
+        assert creator.cache_info().hits == 2
+
+    def test_unique_inputs_stay_bounded(self):
+        """Test adversarial unique phrases cannot grow the cache."""
+        creator = AcronymCreator(cache_size=8)
+        options = AcronymOptions()
+        for i in range(500):
+            creator.create_basic_acronym(f"Phrase number {i}", options)
+        stats = creator.cache_info()
+        assert stats.size == 8
+        assert stats.evictions == 492
+
+    def test_long_phrases_bypass_cache(self):
+        """Test phrases over the length cap are not cached."""
+        creator = AcronymCreator(cache_size=8)
+        phrase = "word " * (MAX_CACHED_PHRASE_LENGTH // 5 + 1)
+        creator.create_basic_acronym(phrase, AcronymOptions())
+        assert creator.cache_info().size == 0
@@ -5,7 +5,10 @@ Tests for the CLI module.
 import csv
 import io
 import json
+import subprocess
+import sys
 import tomllib
+from pathlib import Path
 from click.testing import CliRunner
 from src.acronymcreator.cli import main
 
@@ -89,6 +92,14 @@ class TestCLI:
         assert output["options"]["include_articles"] is True
         assert output["options"]["min_word_length"] == 1
 
+    def test_cli_jsonl_output(self):
+        """Test CLI with JSON Lines output format."""
+        result = self.runner.invoke(main, ["Hello World", "--format", "jsonl"])
+        assert result.exit_code == 0
+        assert len(result.output.splitlines()) == 1
+        output = json.loads(result.output)
+        assert output["acronym"] == "HW"
+
     def test_cli_yaml_output(self):
         """Test CLI with YAML output format."""
         result = self.runner.invoke(main, ["Hello World", "--format", "yaml"])
@@ -477,3 +488,190 @@ class TestCLI:
 
         assert output["phrase"] == 'Hello, World! "Test"'
         assert output["acronym"] == "HWT"
+
+
+class TestCLIBatchInput:
+    """Test cases for batch mode (--input)."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+        self.phrases = "Hello World\nThe Quick Brown Fox\n\nPortable Document Format\n"
+
+    def test_batch_text_from_stdin(self):
+        """Test batch mode reads stdin and writes one acronym per line."""
+        result = self.runner.invoke(main, ["--input", "-"], input=self.phrases)
+        assert result.exit_code == 0
+        assert result.output.split("\n") == ["HW", "QBF", "", "PDF", ""]
+
+    def test_batch_text_from_file(self, tmp_path):
+        """Test batch mode reads phrases from a file."""
+        path = tmp_path / "phrases.txt"
+        path.write_text("Hello World\r\nFoo Bar Baz\r\n")
+        result = self.runner.invoke(main, ["--input", str(path), "--lowercase"])
+        assert result.exit_code == 0
+        assert result.output == "hw\nfbb\n"
+
+    def test_batch_applies_options(self):
+        """Test batch mode applies options to every line."""
+        result = self.runner.invoke(
+            main,
+            ["--input", "-", "--include-articles", "--max-words", "2"],
+            input="The Quick Brown Fox\nOne Two Three\n",
+        )
+        assert result.exit_code == 0
+        assert result.output == "TQ\nOT\n"
+
+    def test_batch_json_array(self):
+        """Test batch JSON output is a single JSON array."""
+        result = self.runner.invoke(
+            main, ["--input", "-", "--format", "json"], input=self.phrases
+        )
+        assert result.exit_code == 0
+        records = json.loads(result.output)
+        assert [r["acronym"] for r in records] == ["HW", "QBF", "", "PDF"]
+        assert records[1]["phrase"] == "The Quick Brown Fox"
+        assert records[0]["options"]["min_word_length"] == 2
+
+    def test_batch_json_empty_input(self):
+        """Test batch JSON output with no input is an empty array."""
+        result = self.runner.invoke(
+            main, ["--input", "-", "--format", "json"], input=""
+        )
+        assert result.exit_code == 0
+        assert json.loads(result.output) == []
+
+    def test_batch_json_lines(self):
+        """Test batch JSON Lines output writes one object per line."""
+        result = self.runner.invoke(
+            main, ["--input", "-", "--format", "jsonl"], input=self.phrases
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["acronym"] for r in records] == ["HW", "QBF", "", "PDF"]
+
+    def test_batch_flush_every(self):
+        """Test small flush batches produce the same output."""
+        result = self.runner.invoke(
+            main,
+            ["--input", "-", "--format", "csv", "--flush-every", "1"],
+            input=self.phrases,
+        )
+        assert result.exit_code == 0
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+        assert [r["acronym"] for r in rows] == ["HW", "QBF", "", "PDF"]
+
+    def test_batch_flush_every_must_be_positive(self):
+        """Test --flush-every rejects values below one."""
+        result = self.runner.invoke(
+            main, ["--input", "-", "--flush-every", "0"], input=""
+        )
+        assert result.exit_code == 2
+
+    def test_batch_yaml_sequence(self):
+        """Test batch YAML output forms a single sequence of records."""
+        import yaml
+
+        result = self.runner.invoke(
+            main, ["--input", "-", "--format", "yaml"], input=self.phrases
+        )
+        assert result.exit_code == 0
+        records = yaml.safe_load(result.output)
+        assert [r["acronym"] for r in records] == ["HW", "QBF", "", "PDF"]
+        assert records[3]["options"]["lowercase"] is False
+
+    def test_batch_csv_single_header(self):
+        """Test batch CSV output writes the header once."""
+        result = self.runner.invoke(
+            main, ["--input", "-", "--format", "csv"], input=self.phrases
+        )
+        assert result.exit_code == 0
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+        assert [r["acronym"] for r in rows] == ["HW", "QBF", "", "PDF"]
+        assert result.output.count("phrase,acronym") == 1
+
+    def test_batch_tsv(self):
+        """Test batch TSV output."""
+        result = self.runner.invoke(
+            main, ["--input", "-", "--format", "tsv"], input="Hello, World\n"
+        )
+        assert result.exit_code == 0
+        rows = list(csv.DictReader(io.StringIO(result.output), delimiter="\t"))
+        assert rows == [
+            {
+                "phrase": "Hello, World",
+                "acronym": "HW",
+                "include_articles": "false",
+                "min_word_length": "2",
+                "max_words": "",
+                "lowercase": "false",
+            }
+        ]
+
+    def test_batch_toml_array_of_tables(self):
+        """Test batch TOML output forms an array of tables."""
+        result = self.runner.invoke(
+            main, ["--input", "-", "--format", "toml"], input=self.phrases
+        )
+        assert result.exit_code == 0
+        output = tomllib.loads(result.output)
+        assert [r["acronym"] for r in output["results"]] == ["HW", "QBF", "", "PDF"]
+        assert output["results"][0]["max_words"] == ""
+
+    def test_batch_empty_input(self):
+        """Test batch mode with no input lines."""
+        result = self.runner.invoke(main, ["--input", "-"], input="")
+        assert result.exit_code == 0
+        assert result.output == ""
+
+    def test_phrase_and_input_are_exclusive(self):
+        """Test that PHRASE and --input cannot be combined."""
+        result = self.runner.invoke(main, ["Hello World", "--input", "-"], input="")
+        assert result.exit_code == 2
+        assert "not both" in result.output
+
+    def test_phrase_or_input_required(self):
+        """Test that either PHRASE or --input is required."""
+        result = self.runner.invoke(main, [])
+        assert result.exit_code == 2
+
+
+class TestCLILazyFormatters:
+    """Test that serializers are only imported for the chosen format."""
+
+    SCRIPT = (
+        "import sys\n"
+        "from src.acronymcreator.cli import main\n"
+        "try:\n"
+        "    main(sys.argv[1:])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(' '.join(m for m in ('yaml', 'tomli_w') if m in sys.modules))\n"
+    )
+
+    def run_cli(self, *args):
+        """Run the CLI in a fresh interpreter and return loaded serializers."""
+        root = Path(__file__).resolve().parent.parent
+        completed = subprocess.run(
+            [sys.executable, "-c", self.SCRIPT, *args],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return completed.stdout.splitlines()
+
+    def test_text_format_imports_no_serializers(self):
+        """Test a plain text run does not import yaml or tomli_w."""
+        output = self.run_cli("Hello World")
+        assert output == ["HW", ""]
+
+    def test_json_format_imports_no_yaml(self):
+        """Test a json run does not import yaml or tomli_w."""
+        output = self.run_cli("Hello World", "--format", "json")
+        assert output[-1] == ""
+
+    def test_yaml_format_imports_yaml_only(self):
+        """Test a yaml run imports yaml but not tomli_w."""
+        output = self.run_cli("Hello World", "--format", "yaml")
+        assert output[-1] == "yaml"
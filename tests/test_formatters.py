@@ -0,0 +1,66 @@
+"""
+Tests for the output formatter registry.
+"""
+
+import io
+
+import pytest
+
+from src.acronymcreator.formatters import (
+    FORMATTERS,
+    CsvFormatter,
+    Formatter,
+    TsvFormatter,
+    get_formatter,
+)
+
+SETTINGS = {
+    "include_articles": False,
+    "min_word_length": 2,
+    "max_words": None,
+    "lowercase": False,
+}
+
+
+class TestFormatters:
+    """Test cases for the formatter registry."""
+
+    def test_registry_covers_all_formats(self):
+        """Test every CLI format has a registered formatter."""
+        assert set(FORMATTERS) == {
+            "text",
+            "json",
+            "jsonl",
+            "yaml",
+            "csv",
+            "tsv",
+            "toml",
+        }
+
+    def test_get_formatter_is_case_insensitive(self):
+        """Test format names are matched case-insensitively."""
+        assert isinstance(get_formatter("TSV"), TsvFormatter)
+        assert isinstance(get_formatter("csv"), CsvFormatter)
+
+    def test_get_formatter_unknown(self):
+        """Test unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown output format"):
+            get_formatter("xml")
+
+    def test_base_formatter_is_abstract(self):
+        """Test the base class requires subclasses to render."""
+        formatter = Formatter()
+        formatter.begin(io.StringIO())
+        with pytest.raises(NotImplementedError):
+            formatter.format_single("Hello World", "HW", SETTINGS)
+        with pytest.raises(NotImplementedError):
+            formatter.write(io.StringIO(), "Hello World", "HW", SETTINGS)
+
+    def test_text_formatter(self):
+        """Test the text formatter renders only the acronym."""
+        formatter = get_formatter("text")
+        stream = io.StringIO()
+        formatter.begin(stream)
+        formatter.write(stream, "Hello World", "HW", SETTINGS)
+        assert formatter.format_single("Hello World", "HW", SETTINGS) == "HW"
+        assert stream.getvalue() == "HW\n"
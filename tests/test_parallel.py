@@ -0,0 +1,89 @@
+"""
+Tests for the bulk create_many / generate_many API.
+"""
+
+import pytest
+
+from src.acronymcreator import parallel
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+PHRASES = [f"Phrase number {i} for the Bulk API" for i in range(40)] + [
+    "",
+    "The Quick Brown Fox",
+]
+
+
+class TestCreateMany:
+    """Test cases for bulk acronym generation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.creator = AcronymCreator()
+        self.options = AcronymOptions(max_words=3)
+        self.expected = [
+            (phrase, self.creator.create_basic_acronym(phrase, self.options))
+            for phrase in PHRASES
+        ]
+
+    def test_in_process_below_threshold(self):
+        """Test small batches run in-process and keep input order."""
+        results = list(self.creator.create_many(PHRASES, self.options, workers=4))
+        assert results == self.expected
+
+    def test_in_process_single_worker(self):
+        """Test workers=1 never starts a pool."""
+        results = self.creator.create_many(
+            iter(PHRASES), self.options, workers=1, parallel_threshold=1
+        )
+        assert list(results) == self.expected
+
+    def test_in_process_uses_creator_cache(self):
+        """Test the in-process path goes through the creator's cache."""
+        creator = AcronymCreator(cache_size=100)
+        list(creator.create_many(PHRASES * 2, self.options, workers=1))
+        assert creator.cache_info().hits == len(PHRASES)
+
+    def test_process_pool_ordered(self):
+        """Test the process pool path keeps input order."""
+        results = self.creator.create_many(
+            iter(PHRASES),
+            self.options,
+            workers=2,
+            chunk_size=3,
+            parallel_threshold=10,
+        )
+        assert list(results) == self.expected
+
+    def test_process_pool_unordered(self):
+        """Test unordered results contain every phrase exactly once."""
+        results = self.creator.create_many(
+            PHRASES,
+            self.options,
+            workers=2,
+            chunk_size=4,
+            ordered=False,
+            parallel_threshold=10,
+        )
+        assert sorted(results) == sorted(self.expected)
+
+    def test_process_pool_early_stop(self):
+        """Test abandoning the iterator shuts the pool down cleanly."""
+        results = self.creator.create_many(
+            PHRASES, self.options, workers=2, chunk_size=2, parallel_threshold=10
+        )
+        assert next(results) == self.expected[0]
+        results.close()
+
+    def test_generate_many(self):
+        """Test generate_many matches generate_multiple_options."""
+        expected = [(p, self.creator.generate_multiple_options(p)) for p in PHRASES]
+        results = self.creator.generate_many(
+            PHRASES, workers=2, chunk_size=5, parallel_threshold=10
+        )
+        assert list(results) == expected
+        assert list(self.creator.generate_many(PHRASES[:3])) == expected[:3]
+
+    def test_invalid_chunk_size(self):
+        """Test a non-positive chunk size is rejected immediately."""
+        with pytest.raises(ValueError):
+            parallel.run_many(self.creator, "create_basic_acronym", [], chunk_size=0)
@@ -0,0 +1,97 @@
+"""
+Tests for the memory-mapped line reader.
+"""
+
+import pytest
+
+from src.acronymcreator import readers
+from src.acronymcreator.readers import MappedLineReader
+
+
+def write(tmp_path, data):
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(data)
+    return path
+
+
+class TestMappedLineReader:
+    """Test cases for the MappedLineReader class."""
+
+    def test_lines_match_text_mode(self, tmp_path):
+        """Test lines match universal-newline text reading."""
+        data = "Hello World\r\nCafé Olé\n\nlast line without newline".encode()
+        path = write(tmp_path, data)
+        with open(path, encoding="utf-8") as handle:
+            expected = [line.rstrip("\r\n") for line in handle]
+        with MappedLineReader(path) as reader:
+            assert list(reader) == expected
+
+    def test_raw_lines_are_bytes(self, tmp_path):
+        """Test raw lines are returned undecoded."""
+        path = write(tmp_path, b"one\ntwo\n")
+        with MappedLineReader(path) as reader:
+            assert list(reader.iter_raw_lines()) == [b"one", b"two"]
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file yields no lines and one empty split."""
+        path = write(tmp_path, b"")
+        with MappedLineReader(path) as reader:
+            assert list(reader) == []
+            assert reader.split(4) == []
+            assert reader.line_start(3) == 0
+
+    @pytest.mark.parametrize("parts", [1, 2, 3, 7, 50])
+    def test_split_ranges_cover_every_line_once(self, tmp_path, parts):
+        """Test line-aligned ranges partition the file's lines."""
+        lines = [f"Phrase number {i} " * (i % 4 + 1) for i in range(40)]
+        path = write(tmp_path, "\n".join(lines).encode() + b"\n")
+        with MappedLineReader(path) as reader:
+            ranges = reader.split(parts)
+            assert ranges[0][0] == 0 and ranges[-1][1] == reader.size
+            assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+            collected = []
+            for start, end in ranges:
+                collected.extend(reader.iter_lines(start, end))
+            assert collected == lines
+
+    def test_unaligned_ranges_do_not_duplicate_lines(self, tmp_path):
+        """Test arbitrary byte ranges assign each line to one range."""
+        path = write(tmp_path, b"aaaa\nbbbb\ncccc\n")
+        with MappedLineReader(path) as reader:
+            assert list(reader.iter_lines(0, 2)) == ["aaaa"]
+            assert list(reader.iter_lines(2, 7)) == ["bbbb"]
+            assert list(reader.iter_lines(7, 100)) == ["cccc"]
+            assert list(reader.iter_lines(5, 5)) == []
+
+    def test_small_blocks_and_long_lines(self, tmp_path, monkeypatch):
+        """Test lines spanning several blocks are read whole."""
+        monkeypatch.setattr(readers, "BLOCK_SIZE", 8)
+        lines = ["short", "x" * 50, "mid line", "y" * 9]
+        path = write(tmp_path, "\n".join(lines).encode())
+        with MappedLineReader(path) as reader:
+            assert list(reader) == lines
+
+    def test_interleaved_iterators(self, tmp_path):
+        """Test two iterators over one reader do not interfere."""
+        path = write(tmp_path, b"a\nb\nc\nd\n")
+        with MappedLineReader(path) as reader:
+            first, second = reader.iter_lines(0, 4), reader.iter_lines(4)
+            assert [next(first), next(second), next(first), next(second)] == [
+                "a",
+                "c",
+                "b",
+                "d",
+            ]
+
+    def test_decoding_errors_setting(self, tmp_path):
+        """Test the errors handler is applied per line."""
+        path = write(tmp_path, b"ok\n\xffbad\n")
+        with MappedLineReader(path, errors="replace") as reader:
+            assert list(reader) == ["ok", "�bad"]
+
+    def test_invalid_parts(self, tmp_path):
+        """Test split rejects fewer than one part."""
+        path = write(tmp_path, b"a\n")
+        with MappedLineReader(path) as reader:
+            with pytest.raises(ValueError):
+                reader.split(0)
@@ -0,0 +1,237 @@
+"""
+Tests for the local acronym server.
+"""
+
+import http.client
+import json
+import os
+import signal
+import socket
+import threading
+
+import pytest
+
+from src.acronymcreator.core import AcronymCreator
+from src.acronymcreator.server import (
+    AcronymService,
+    RequestError,
+    create_server,
+    parse_settings,
+    serve_until_stopped,
+)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def request(connection, method, path, payload=None):
+    """Send a JSON request and return (status, decoded body)."""
+    body = None if payload is None else json.dumps(payload)
+    headers = {"Content-Type": "application/json"} if body else {}
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+@pytest.fixture
+def http_server():
+    """Run an HTTP server on an ephemeral port."""
+    server = create_server(port=0)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestService:
+    """Test cases for request handling independent of transport."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = AcronymService()
+
+    def test_acronym_matches_json_format(self):
+        """Test single responses have the --format json shape."""
+        response = self.service.acronym({"phrase": "The Quick Brown Fox"})
+        assert response == {
+            "phrase": "The Quick Brown Fox",
+            "acronym": "QBF",
+            "options": {
+                "include_articles": False,
+                "min_word_length": 2,
+                "max_words": None,
+                "lowercase": False,
+            },
+        }
+
+    def test_acronym_with_options(self):
+        """Test options are applied."""
+        response = self.service.acronym(
+            {
+                "phrase": "The Quick Brown Fox",
+                "options": {"include_articles": True, "lowercase": True},
+            }
+        )
+        assert response["acronym"] == "tqbf"
+
+    def test_acronym_empty_result(self):
+        """Test an empty result is reported as unprocessable."""
+        with pytest.raises(RequestError) as error:
+            self.service.acronym({"phrase": "!!!"})
+        assert error.value.status == 422
+
+    def test_batch_keeps_empty_results(self):
+        """Test batch responses keep one result per phrase."""
+        response = self.service.batch({"phrases": ["Hello World", ""]})
+        assert [r["acronym"] for r in response["results"]] == ["HW", ""]
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            [],
+            {"colour": True},
+            {"lowercase": "yes"},
+            {"min_word_length": "2"},
+            {"max_words": True},
+        ],
+    )
+    def test_invalid_options(self, options):
+        """Test invalid options are rejected."""
+        with pytest.raises(RequestError):
+            parse_settings(options)
+
+    def test_invalid_phrase_types(self):
+        """Test phrases must be strings."""
+        with pytest.raises(RequestError):
+            self.service.acronym({"phrase": 1})
+        with pytest.raises(RequestError):
+            self.service.batch({"phrases": ["ok", 2]})
+
+
+class TestHTTPServer:
+    """Test cases for the HTTP transport."""
+
+    def connect(self, server):
+        return http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+
+    def test_health(self, http_server):
+        """Test the health endpoint."""
+        status, body = request(self.connect(http_server), "GET", "/health")
+        assert (status, body) == (200, {"status": "ok"})
+
+    def test_single_and_batch_on_one_connection(self, http_server):
+        """Test keep-alive connections can issue several requests."""
+        connection = self.connect(http_server)
+        status, body = request(
+            connection, "POST", "/acronym", {"phrase": "Hello World"}
+        )
+        assert (status, body["acronym"]) == (200, "HW")
+        status, body = request(
+            connection,
+            "POST",
+            "/batch",
+            {"phrases": ["Hello World", "Foo Bar"], "options": {"lowercase": True}},
+        )
+        assert status == 200
+        assert [r["acronym"] for r in body["results"]] == ["hw", "fb"]
+
+    def test_errors(self, http_server):
+        """Test client errors are returned as JSON."""
+        connection = self.connect(http_server)
+        assert request(connection, "GET", "/nope")[0] == 404
+        assert request(connection, "POST", "/nope", {})[0] == 404
+        assert request(connection, "POST", "/acronym", [1])[0] == 400
+        assert request(connection, "POST", "/acronym", {"phrase": "!"})[0] == 422
+        connection.request("POST", "/acronym", body="{not json")
+        response = connection.getresponse()
+        assert response.status == 400
+        assert "valid JSON" in json.loads(response.read())["error"]
+        connection.request("POST", "/acronym", headers={"Content-Length": "x"})
+        assert connection.getresponse().status == 400
+
+    def test_body_too_large(self, http_server, monkeypatch):
+        """Test oversized bodies are rejected without being read."""
+        monkeypatch.setattr("src.acronymcreator.server.MAX_BODY_BYTES", 10)
+        status, body = request(
+            self.connect(http_server), "POST", "/batch", {"phrases": ["x" * 20]}
+        )
+        assert status == 413
+
+    def test_concurrent_clients(self, http_server):
+        """Test many clients can be served at once."""
+        results = []
+
+        def client(i):
+            status, body = request(
+                self.connect(http_server),
+                "POST",
+                "/acronym",
+                {"phrase": f"Client Number {i}"},
+            )
+            results.append((status, body["acronym"], i))
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results, key=lambda r: r[2]) == [
+            (200, "CN" if i < 10 else "CN1", i) for i in range(20)
+        ]
+
+
+class TestUnixServer:
+    """Test cases for the Unix domain socket transport."""
+
+    def test_unix_socket(self, tmp_path):
+        """Test requests over a Unix socket and cleanup on close."""
+        path = str(tmp_path / "acronyms.sock")
+        service = AcronymService(AcronymCreator(cache_size=10))
+        server = create_server(socket_path=path, service=service)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            status, body = request(
+                UnixHTTPConnection(path), "POST", "/acronym", {"phrase": "Hello World"}
+            )
+            assert (status, body["acronym"]) == (200, "HW")
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        assert not os.path.exists(path)
+
+    def test_graceful_shutdown_on_sigterm(self, tmp_path):
+        """Test SIGTERM stops the server and removes the socket."""
+        path = str(tmp_path / "acronyms.sock")
+        server = create_server(socket_path=path)
+        timer = threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGTERM))
+        timer.start()
+        serve_until_stopped(server)
+        timer.join()
+        assert not os.path.exists(path)
+
+
+class TestServeCommand:
+    """Test the CLI serve subcommand wiring."""
+
+    def test_serve_help(self):
+        """Test serve is registered as a subcommand."""
+        from click.testing import CliRunner
+
+        from src.acronymcreator.cli import main
+
+        result = CliRunner().invoke(main, ["serve", "--help"])
+        assert result.exit_code == 0
+        assert "--socket" in result.output
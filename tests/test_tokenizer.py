@@ -0,0 +1,123 @@
+"""
+Tests for the single-pass tokenizer.
+"""
+
+import random
+import re
+
+import pytest
+
+from src.acronymcreator import tokenizer
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+
+def reference_extract_words(phrase, options):
+    """The original clean_phrase + split + two-filter pipeline."""
+    if not phrase.strip():
+        return []
+    cleaned = re.sub(r"[^\w\s]", "", phrase)
+    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    words = cleaned.split()
+    if not options.include_articles:
+        words = [w for w in words if w.lower() not in AcronymCreator.COMMON_WORDS]
+    return [w for w in words if len(w) >= options.min_word_length]
+
+
+PHRASES = [
+    "",
+    "   ",
+    "Hello World",
+    "The Quick Brown Fox",
+    "  Hello,   World!  How are you?  ",
+    "Point of Sale",
+    "To Be Or Not To Be",
+    "don't stop-believing",
+    "e-mail & co.",
+    "!@#$%",
+    "snake_case and_more",
+    "tabs\tand\nnewlines\r\nmixed",
+    "Café Olé Naïve Résumé",
+    "Straße über alles",
+    "数据 库 管理",
+    "ΑΣ ΣΑ ΟΔΟΣ",
+    "non breaking spaces　here",
+    "separators\x1cand\x1fcontrols\x00\x07",
+    "The … ellipsis — dash “quotes”",
+    "A Big Red Car",
+    "x1 y22 z333 4th",
+]
+
+OPTIONS = [
+    AcronymOptions(),
+    AcronymOptions(include_articles=True),
+    AcronymOptions(min_word_length=1),
+    AcronymOptions(min_word_length=3, include_articles=True),
+    AcronymOptions(min_word_length=0),
+]
+
+
+class TestTokenizer:
+    """Test cases for the tokenizer module."""
+
+    def test_tokenize_matches_clean_phrase_split(self):
+        """Test tokenize is equivalent to clean_phrase followed by split."""
+        creator = AcronymCreator()
+        for phrase in PHRASES:
+            assert tokenizer.tokenize(phrase) == creator.clean_phrase(phrase).split()
+
+    @pytest.mark.parametrize("options", OPTIONS)
+    def test_extract_words_matches_reference(self, options):
+        """Test the fused pipeline matches the original on known phrases."""
+        creator = AcronymCreator()
+        for phrase in PHRASES:
+            expected = reference_extract_words(phrase, options)
+            assert creator.extract_words(phrase, options) == expected
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_extract_words_matches_reference_random(self, seed):
+        """Test the fused pipeline matches the original on random input."""
+        rng = random.Random(seed)
+        alphabet = "abcXYZ019_ .,;:!?'\"-()[]\t\n\x0b\x1c  " "éßΣ数́​…—"
+        words = sorted(AcronymCreator.COMMON_WORDS) + ["The", "AND", "Of"]
+        creator = AcronymCreator()
+        for _ in range(300):
+            parts = []
+            for _ in range(rng.randint(0, 12)):
+                if rng.random() < 0.3:
+                    parts.append(rng.choice(words))
+                else:
+                    length = rng.randint(0, 8)
+                    parts.append("".join(rng.choice(alphabet) for _ in range(length)))
+            phrase = rng.choice([" ", "  ", "\t", ", "]).join(parts)
+            for options in OPTIONS:
+                expected = reference_extract_words(phrase, options)
+                assert creator.extract_words(phrase, options) == expected
+
+    def test_extract_words_stopwords_are_case_insensitive(self):
+        """Test stopwords are matched regardless of case."""
+        words = tokenizer.extract_words("THE Cat AND the Hat", {"the", "and"}, 1)
+        assert words == ["Cat", "Hat"]
+
+    def test_extract_words_no_stopwords(self):
+        """Test the empty stopword set keeps every word."""
+        words = tokenizer.extract_words("The Cat", tokenizer.NO_STOPWORDS, 1)
+        assert words == ["The", "Cat"]
+
+
+class TestTokenizedPhrase:
+    """Test cases for the shared tokenized representation."""
+
+    def test_tokenize_phrase_mask(self):
+        """Test the stopword mask flags stopwords case-insensitively."""
+        tokenized = tokenizer.tokenize_phrase("The Lord of the Rings", {"the", "of"})
+        assert tokenized.tokens == ["The", "Lord", "of", "the", "Rings"]
+        assert tokenized.stopword_mask == [True, False, True, True, False]
+
+    @pytest.mark.parametrize("options", OPTIONS)
+    def test_words_match_extract_words(self, options):
+        """Test words derived from the mask match extract_words."""
+        creator = AcronymCreator()
+        for phrase in PHRASES:
+            tokenized = tokenizer.tokenize_phrase(phrase, creator.COMMON_WORDS)
+            words = tokenized.words(options.include_articles, options.min_word_length)
+            assert words == creator.extract_words(phrase, options)
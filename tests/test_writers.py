@@ -0,0 +1,85 @@
+"""
+Tests for the buffered batch writers.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from src.acronymcreator.formatters import get_formatter
+from src.acronymcreator.writers import BatchWriter
+
+SETTINGS = {
+    "include_articles": False,
+    "min_word_length": 2,
+    "max_words": None,
+    "lowercase": False,
+}
+
+
+class CountingStream(io.StringIO):
+    """StringIO that records how often it is flushed."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestBatchWriter:
+    """Test cases for the BatchWriter class."""
+
+    def test_flushes_in_batches(self):
+        """Test rows are handed to the stream every flush_every rows."""
+        stream = CountingStream()
+        writer = BatchWriter(get_formatter("text"), stream, flush_every=2)
+        writer.open()
+        writer.write("Hello World", "HW", SETTINGS)
+        assert stream.getvalue() == ""
+        writer.write("Foo Bar", "FB", SETTINGS)
+        assert stream.getvalue() == "HW\nFB\n"
+        writer.write("Baz Qux", "BQ", SETTINGS)
+        writer.close()
+        assert stream.getvalue() == "HW\nFB\nBQ\n"
+        assert stream.flushes == 2
+        assert writer.rows_written == 3
+
+    def test_csv_header_written_once(self):
+        """Test the CSV header appears once across many flushes."""
+        stream = io.StringIO()
+        with BatchWriter(get_formatter("csv"), stream, flush_every=1) as writer:
+            for i in range(5):
+                writer.write(f"Phrase {i}", "P", SETTINGS)
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        assert len(rows) == 5
+        assert stream.getvalue().count("phrase,acronym") == 1
+
+    def test_json_array_across_flushes(self):
+        """Test streamed JSON stays a valid array across flush boundaries."""
+        stream = io.StringIO()
+        with BatchWriter(get_formatter("json"), stream, flush_every=2) as writer:
+            for i in range(3):
+                writer.write(f"Phrase {i}", "P", SETTINGS)
+        records = json.loads(stream.getvalue())
+        assert [r["phrase"] for r in records] == ["Phrase 0", "Phrase 1", "Phrase 2"]
+
+    def test_buffer_is_reset_after_flush(self):
+        """Test the internal buffer does not grow with the number of rows."""
+        stream = io.StringIO()
+        writer = BatchWriter(get_formatter("jsonl"), stream, flush_every=10)
+        writer.open()
+        for i in range(1000):
+            writer.write(f"Phrase {i}", "P", SETTINGS)
+            assert writer._pending < 10
+        writer.close()
+        assert len(stream.getvalue().splitlines()) == 1000
+
+    def test_invalid_flush_every(self):
+        """Test flush_every must be positive."""
+        with pytest.raises(ValueError):
+            BatchWriter(get_formatter("text"), io.StringIO(), flush_every=0)